@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Benchmark the import and setup cost of the Swedish Nuclear Power integration
+
+Import time: imports the integration in a fresh interpreter with
+-X importtime, after the Home Assistant modules it builds on are already
+loaded (as they are during Home Assistant startup), and reports the
+integration's own cost with a per-module breakdown.
+
+Heavy dependencies (requests, dateutil, the profiler's cProfile) must
+only be imported when first needed, outside the event loop where possible.
+
+Setup time: sets up a config entry in a minimal Home Assistant instance
+while every upstream request stalls, and reports how long setup takes and
+whether the sensors exist when it returns. Setup must not wait for network
+I/O.
+
+Requires Home Assistant to be installed.
+
+    python3 bench_import.py
+    python3 bench_import.py --import-budget-ms 50 --setup-budget-ms 500 --top 15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+INTEGRATION = "custom_components.swedish_nuclear_power"
+DOMAIN = "swedish_nuclear_power"
+
+# Modules Home Assistant has loaded by the time it sets up this integration
+PRELOADED = [
+    "voluptuous",
+    "homeassistant.core",
+    "homeassistant.config_entries",
+    "homeassistant.helpers.config_validation",
+    "homeassistant.helpers.entity",
+    "homeassistant.helpers.event",
+    "homeassistant.helpers.selector",
+    "homeassistant.helpers.update_coordinator",
+    "homeassistant.components.sensor",
+    "homeassistant.components.websocket_api",
+    "homeassistant.util.dt",
+]
+
+# Modules the integration loads when Home Assistant sets it up
+INTEGRATION_MODULES = [INTEGRATION, f"{INTEGRATION}.sensor", f"{INTEGRATION}.config_flow"]
+
+# Dependencies that must not be imported while the integration loads
+HEAVY = ["requests", "urllib3", "dateutil", "cProfile", "pstats"]
+
+MARKER = "--- integration imports ---"
+
+# Home Assistant may already have loaded the heavy dependencies, in which
+# case -X importtime doesn't list them, so the integration's import
+# statements are recorded as well
+TRACK_IMPORTS = f"""
+import builtins, json, sys
+imported = set()
+original_import = builtins.__import__
+
+def tracking_import(name, globals=None, locals=None, fromlist=(), level=0):
+    module = (globals or {{}}).get("__name__") or ""
+    if level == 0 and module.startswith({INTEGRATION!r}):
+        imported.add((name.split(".")[0], module))
+    return original_import(name, globals, locals, fromlist, level)
+
+builtins.__import__ = tracking_import
+"""
+
+
+def measure_imports():
+    """Import the integration in a fresh interpreter.
+
+    Returns the (self_us, cumulative_us, depth, module) rows of -X importtime
+    and the (dependency, importing module) pairs of heavy imports.
+    """
+    code = "\n".join([
+        *(f"import {module}" for module in PRELOADED),
+        TRACK_IMPORTS,
+        f"sys.stderr.write({MARKER!r} + '\\n')",
+        "sys.stderr.flush()",
+        *(f"import {module}" for module in INTEGRATION_MODULES),
+        "builtins.__import__ = original_import",
+        "print(json.dumps(sorted(imported)))",
+    ])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    rows = []
+    lines = result.stderr.splitlines()
+    for line in lines[lines.index(MARKER) + 1:]:
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        if not self_us.strip().isdigit():
+            continue
+        # Nested imports are indented by two spaces per level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((int(self_us), int(cumulative_us), depth, name.strip()))
+
+    heavy = [(name, module) for name, module in json.loads(result.stdout) if name in HEAVY]
+    return rows, heavy
+
+
+async def measure_setup(runs):
+    """Set up and unload a config entry against a stalled upstream, return timings."""
+    from homeassistant import bootstrap, config_entries, loader
+    from homeassistant.core import CoreState, HomeAssistant
+
+    from bench_reload import StallingUpstream
+    from custom_components.swedish_nuclear_power.const import PLANTS
+
+    upstream = StallingUpstream()
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    for plant_config in PLANTS.values():
+        plant_config["url"] = upstream.url_for(plant_config["url"])
+
+    config_dir = tempfile.mkdtemp()
+    os.makedirs(os.path.join(config_dir, "custom_components"))
+    os.symlink(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), "custom_components", DOMAIN),
+        os.path.join(config_dir, "custom_components", DOMAIN),
+    )
+
+    hass = HomeAssistant(config_dir)
+    hass.config.skip_pip = True
+    loader.async_setup(hass)
+    hass.config_entries = config_entries.ConfigEntries(hass, {})
+    await bootstrap.async_load_base_functionality(hass)
+    hass.set_state(CoreState.running)
+    # The websocket API needs the HTTP server, which is out of scope here
+    hass.config.components.update({"http", "websocket_api"})
+
+    timings = []
+    try:
+        for _ in range(runs):
+            # Stall every plant for the whole setup
+            upstream.arm()
+            entry = config_entries.ConfigEntry(
+                domain=DOMAIN,
+                data={"scan_interval": 60},
+                title="Swedish Nuclear Power",
+                version=1,
+                minor_version=1,
+                source=config_entries.SOURCE_USER,
+                options={},
+                unique_id=None,
+                discovery_keys={},
+                subentries_data=None,
+            )
+            started = time.perf_counter()
+            await hass.config_entries.async_add(entry)
+            setup = time.perf_counter() - started
+            sensors = len(hass.states.async_entity_ids("sensor"))
+            if entry.state is not config_entries.ConfigEntryState.LOADED:
+                raise RuntimeError(f"Setup failed: {entry.state}")
+
+            started = time.perf_counter()
+            await hass.config_entries.async_remove(entry.entry_id)
+            unload = time.perf_counter() - started
+            timings.append({"setup_s": setup, "unload_s": unload, "sensors": sensors})
+    finally:
+        upstream.release.set()
+        upstream.shutdown()
+        await hass.async_stop(force=True)
+
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--import-budget-ms", type=float, default=50, help="maximum integration import time (default: 50)")
+    parser.add_argument("--setup-budget-ms", type=float, default=500, help="maximum config entry setup time (default: 500)")
+    parser.add_argument("--runs", type=int, default=5, help="number of import and setup measurements (default: 5)")
+    parser.add_argument("--top", type=int, default=10, help="number of modules in the import breakdown (default: 10)")
+    args = parser.parse_args()
+
+    # Import times are noisy; keep the fastest run, which has the least interference
+    import_runs = [measure_imports() for _ in range(args.runs)]
+    rows, heavy = min(import_runs, key=lambda run: sum(row[1] for row in run[0] if row[2] == 0))
+    import_ms = sum(cumulative for _, cumulative, depth, _ in rows if depth == 0) / 1000
+
+    print(f"Integration import time: {import_ms:.1f} ms (budget {args.import_budget_ms:g} ms)")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cumulative_us, depth, module in sorted(rows, reverse=True)[:args.top]:
+        print(f"{self_us / 1000:>9.2f} {cumulative_us / 1000:>9.2f}  {'  ' * depth}{module}")
+    if heavy:
+        for name, module in heavy:
+            print(f"Heavy import at load: {name} (from {module})")
+    else:
+        print(f"Heavy imports at load: none of {', '.join(HEAVY)}")
+
+    timings = asyncio.run(measure_setup(args.runs))
+    setup_ms = statistics.median(timing["setup_s"] for timing in timings) * 1000
+    unload_ms = statistics.median(timing["unload_s"] for timing in timings) * 1000
+    print(f"\nSetup with stalled upstream: {setup_ms:.1f} ms median (budget {args.setup_budget_ms:g} ms)")
+    print(f"Unload: {unload_ms:.1f} ms median")
+    print(f"Sensors when setup returned: {timings[0]['sensors']}")
+
+    passed = not heavy and import_ms <= args.import_budget_ms and setup_ms <= args.setup_budget_ms
+    print(f"Within budget: {'PASS' if passed else 'FAIL'}", file=sys.stderr)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
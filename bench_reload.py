@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark reloading the Swedish Nuclear Power coordinator while upstream is stalled
+
+A local HTTP server stands in for the plants. The first request to every
+plant stalls (as a hung upstream would), so a refresh is in flight when the
+coordinator is torn down; later requests are answered normally. Each run
+measures how long the teardown takes, how long the in-flight refresh and
+its executor jobs keep running afterwards, and the full reload latency
+(teardown plus the first refresh of a new coordinator).
+
+Requires Home Assistant to be installed (the real coordinator is used).
+
+    python3 bench_reload.py --runs 5
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from custom_components.swedish_nuclear_power.const import PLANTS
+from custom_components.swedish_nuclear_power.coordinator import SwedishNuclearPowerCoordinator
+
+# Reload latency target in seconds
+TARGET = 1.0
+
+# How long a stalled request hangs before the server gives up on it
+STALL = 120
+
+
+class StallingUpstream(ThreadingHTTPServer):
+    """Fake plant server whose first request per plant and run hangs."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), UpstreamHandler)
+        self.plant_by_path = {urlsplit(config["url"]).path: key for key, config in PLANTS.items()}
+        self.stall_pending = set()
+        self.stalled = 0
+        self.release = threading.Event()
+        self.lock = threading.Lock()
+
+    def arm(self):
+        """Stall the next request to every plant."""
+        with self.lock:
+            self.stall_pending = set(PLANTS)
+            self.stalled = 0
+
+    def url_for(self, url):
+        """Return the local URL standing in for a plant URL."""
+        return f"http://127.0.0.1:{self.server_address[1]}{urlsplit(url).path}"
+
+
+class UpstreamHandler(BaseHTTPRequestHandler):
+    """Answer plant requests, stalling the armed ones."""
+
+    def do_GET(self):
+        server = self.server
+        plant_key = server.plant_by_path[urlsplit(self.path).path]
+        with server.lock:
+            stall = plant_key in server.stall_pending
+            server.stall_pending.discard(plant_key)
+            if stall:
+                server.stalled += 1
+        if stall:
+            server.release.wait(STALL)
+            return
+
+        plant_config = PLANTS[plant_key]
+        if plant_config.get("api", False):
+            body = json.dumps({"value": 1400, "timestamp": "2024-01-01T00:00:00Z", "valueDate": "2024-01-01T00:00:00Z"})
+        else:
+            document = json.dumps({
+                "powerPlant": plant_config["name"],
+                "timestamp": "2024-01-01T00:00:00Z",
+                "blockProductionDataList": [
+                    {"name": reactor, "production": 1000, "percent": 95.0}
+                    for reactor in plant_config["reactors"]
+                ],
+            })
+            body = f'<html><script type="application/json">{document}</script></html>'
+
+        payload = body.encode()
+        try:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+        except OSError:
+            pass
+
+    def log_message(self, format, *args):
+        pass
+
+
+async def run_once(hass, upstream):
+    """Reload once with a stalled refresh in flight and return the timings."""
+    old = SwedishNuclearPowerCoordinator(hass, 60)
+
+    # Record when the executor jobs of the stalled refresh actually return
+    workers_done = []
+    fetch_plant = old.client.fetch_plant
+
+    def timed_fetch_plant(plant_key):
+        try:
+            return fetch_plant(plant_key)
+        finally:
+            workers_done.append(time.perf_counter())
+
+    old.client.fetch_plant = timed_fetch_plant
+
+    upstream.arm()
+    refresh = asyncio.ensure_future(old.async_refresh())
+    deadline = time.perf_counter() + 5
+    while upstream.stalled < len(PLANTS):
+        if time.perf_counter() > deadline:
+            raise RuntimeError("Upstream requests did not stall")
+        await asyncio.sleep(0.01)
+
+    started = time.perf_counter()
+    await old.async_shutdown()
+    unloaded = time.perf_counter()
+    await refresh
+    refresh_done = time.perf_counter()
+
+    new = SwedishNuclearPowerCoordinator(hass, 60)
+    await new.async_refresh()
+    reloaded = time.perf_counter()
+    if not new.data or len(new.data) != len(PLANTS):
+        raise RuntimeError(f"New coordinator got incomplete data: {new.data}")
+
+    # Give the abandoned workers time to come back, bounded by the stall
+    deadline = time.perf_counter() + STALL
+    while len(workers_done) < len(PLANTS) and time.perf_counter() < deadline:
+        await asyncio.sleep(0.01)
+    await new.async_shutdown()
+
+    return {
+        "unload_s": unloaded - started,
+        "inflight_refresh_s": refresh_done - started,
+        "workers_released_s": max(workers_done) - started if len(workers_done) == len(PLANTS) else float("inf"),
+        "reload_s": reloaded - started,
+    }
+
+
+async def bench(runs):
+    """Run the benchmark and return the timings of each run."""
+    upstream = StallingUpstream()
+    threading.Thread(target=upstream.serve_forever, daemon=True).start()
+    for plant_config in PLANTS.values():
+        plant_config["url"] = upstream.url_for(plant_config["url"])
+
+    hass = HomeAssistant(tempfile.mkdtemp())
+    frame.async_setup(hass)
+    try:
+        return [await run_once(hass, upstream) for _ in range(runs)]
+    finally:
+        upstream.release.set()
+        upstream.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="number of reloads (default: 5)")
+    parser.add_argument("--json", action="store_true", help="print the timings as JSON")
+    args = parser.parse_args()
+
+    results = asyncio.run(bench(args.runs))
+    summary = {
+        metric: {
+            "median": statistics.median(result[metric] for result in results),
+            "max": max(result[metric] for result in results),
+        }
+        for metric in results[0]
+    }
+
+    if args.json:
+        print(json.dumps({"target_s": TARGET, "runs": results, "summary": summary}, indent=2))
+    else:
+        print(f"{'metric':<20} {'median':>9} {'max':>9}")
+        for metric, values in summary.items():
+            print(f"{metric:<20} {values['median']:>8.3f}s {values['max']:>8.3f}s")
+
+    # Abandoned workers still hold sockets, so they have to be released in time too
+    passed = max(summary["reload_s"]["max"], summary["workers_released_s"]["max"]) < TARGET
+    print(f"Reload and worker release target < {TARGET:g}s: {'PASS' if passed else 'FAIL'}", file=sys.stderr)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
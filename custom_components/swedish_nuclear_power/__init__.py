@@ -4,10 +4,21 @@ from __future__ import annotations
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
 from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN, CONF_SCAN_INTERVAL
+from .const import (
+    CONF_COLLECTOR_SOCKET,
+    CONF_SCAN_INTERVAL,
+    CONF_SOURCE,
+    DEFAULT_COLLECTOR_SOCKET,
+    DOMAIN,
+    SIGNAL_ENTRY_UNLOADED,
+    SOURCE_INTERNET,
+)
 from .coordinator import SwedishNuclearPowerCoordinator
+from .services import async_setup_services
+from .websocket_api import async_register_websocket_commands
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 
@@ -15,28 +26,49 @@ PLATFORMS: list[Platform] = [Platform.SENSOR]
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Swedish Nuclear Power from a config entry."""
     scan_interval = entry.options.get(CONF_SCAN_INTERVAL, entry.data.get(CONF_SCAN_INTERVAL, 60))
+    source = entry.options.get(CONF_SOURCE, entry.data.get(CONF_SOURCE, SOURCE_INTERNET))
+    collector_socket = entry.options.get(
+        CONF_COLLECTOR_SOCKET, entry.data.get(CONF_COLLECTOR_SOCKET, DEFAULT_COLLECTOR_SOCKET)
+    )
     
-    coordinator = SwedishNuclearPowerCoordinator(hass, scan_interval)
+    coordinator = SwedishNuclearPowerCoordinator(
+        hass, scan_interval, source, collector_socket
+    )
     
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
-    # Fetch initial data
-    await coordinator.async_config_entry_first_refresh()
+    # Fetch initial data in the background, so setup doesn't wait for the
+    # plants; the sensors show unknown until it arrives
+    entry.async_create_background_task(
+        hass, coordinator.async_refresh(), f"{DOMAIN} first refresh"
+    )
+
+    # Reload when the options (e.g. the data source) change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
     
     return True
 
 
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator: SwedishNuclearPowerCoordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
+        async_dispatcher_send(hass, SIGNAL_ENTRY_UNLOADED, entry.entry_id)
 
     return unload_ok
 
 
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Swedish Nuclear Power component."""
+    async_register_websocket_commands(hass)
+    async_setup_services(hass)
     return True
\ No newline at end of file
@@ -0,0 +1,419 @@
+"""Client for fetching data from Swedish nuclear power plants.
+
+This module does not depend on Home Assistant, so the same fetching and
+parsing code is shared by the coordinator and the standalone command line
+tool (``nuclear_cli.py``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import logging
+import re
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from .const import PLANTS
+
+if TYPE_CHECKING:
+    import requests
+
+    from .session import AbortableHTTPAdapter
+
+_LOGGER = logging.getLogger(__name__)
+
+REQUEST_TIMEOUT = 30
+CONNECT_TIMEOUT = 10
+
+ExecutorJob = Callable[..., Awaitable[Any]]
+ReactorKey = Tuple[str, str]
+
+# Compiled once, since every refresh scrapes the plant pages
+_JSON_SCRIPT_RE = re.compile(
+    r'<script[^>]*type="application/json"[^>]*>(.*?)</script>', re.DOTALL
+)
+_JSON_DECODER = json.JSONDecoder()
+
+
+class NuclearPowerClient:
+    """Fetch and normalize production data from the nuclear power plants."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Created by the first fetch, so requests is imported in the executor
+        self.session: Optional[requests.Session] = None
+        self._adapter: Optional[AbortableHTTPAdapter] = None
+        self._session_lock = threading.Lock()
+        # Monotonic time of the last successful fetch per plant
+        self.last_fetch: Dict[str, float] = {}
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._closed = False
+
+    async def async_fetch_all_plants(
+        self,
+        executor_job: Optional[ExecutorJob] = None,
+        plants: Optional[Iterable[str]] = None,
+    ) -> Dict[str, Any]:
+        """Fetch data from all (or the given) plants concurrently.
+
+        The blocking requests run through ``executor_job``, which has the
+        signature of ``hass.async_add_executor_job``. When omitted, the
+        running loop's default executor is used. Returns no data once the
+        client is closed.
+        """
+        if executor_job is None:
+            executor_job = functools.partial(
+                asyncio.get_running_loop().run_in_executor, None
+            )
+
+        plant_keys = list(PLANTS if plants is None else plants)
+        results = await asyncio.gather(
+            *(
+                self.async_fetch_plant(plant_key, executor_job)
+                for plant_key in plant_keys
+            ),
+            return_exceptions=True,
+        )
+
+        if self._closed:
+            # Fetches cancelled by close() aren't failures worth logging
+            return {}
+
+        all_data = {}
+        for plant_key, result in zip(plant_keys, results):
+            # A cancelled plant task is returned as a CancelledError
+            if isinstance(result, BaseException):
+                _LOGGER.warning(
+                    f"Failed to fetch data from {PLANTS[plant_key]['name']}: "
+                    f"{str(result) or type(result).__name__}"
+                )
+            elif result:
+                all_data[plant_key] = result
+
+        return all_data
+
+    async def async_fetch_plant(
+        self, plant_key: str, executor_job: ExecutorJob
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single plant, joining a fetch of that plant already in flight."""
+        if (task := self._inflight.get(plant_key)) is None:
+            task = asyncio.ensure_future(self._async_fetch_plant(plant_key, executor_job))
+            self._inflight[plant_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(plant_key, None))
+        # A cancelled caller must not cancel the fetch for the others joining it
+        return await asyncio.shield(task)
+
+    async def _async_fetch_plant(
+        self, plant_key: str, executor_job: ExecutorJob
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch a single plant in the executor and record when it succeeded."""
+        data = await executor_job(self.fetch_plant, plant_key)
+        if data:
+            self.last_fetch[plant_key] = time.monotonic()
+        return data
+
+    def fetch_age(self, plant_key: str) -> float:
+        """Return the seconds since the plant was last fetched successfully."""
+        if (last_fetch := self.last_fetch.get(plant_key)) is None:
+            return float("inf")
+        return time.monotonic() - last_fetch
+
+    def fetch_plant(self, plant_key: str) -> Optional[Dict[str, Any]]:
+        """Fetch data from a single plant."""
+        if self._closed:
+            return None
+        plant_config = PLANTS[plant_key]
+        if plant_config.get("api", False):
+            # O3 API call
+            return self.fetch_okg_data(plant_config)
+        # Vattenfall scraping
+        return self.fetch_vattenfall_data(plant_key, plant_config)
+
+    def get_session(self) -> requests.Session:
+        """Return the HTTP session, creating it on first use.
+
+        Blocking: the first call imports requests. Raises RequestException
+        once the client is closed.
+        """
+        from requests import RequestException
+
+        with self._session_lock:
+            if self.session is None and not self._closed:
+                from .session import create_session
+
+                self.session, self._adapter = create_session()
+            # Checked after the session is stored: if close() ran earlier it
+            # may have missed the session, otherwise it aborts its connections
+            if self._closed:
+                raise RequestException("Client closed")
+            return self.session
+
+    def fetch_vattenfall_data(
+        self, plant_key: str, plant_config: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Fetch data from Vattenfall plants (Ringhals, Forsmark)."""
+        from requests import RequestException
+
+        try:
+            url = plant_config["url"]
+            _LOGGER.info(f"Fetching data from {url}")
+
+            response = self.get_session().get(
+                url, timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+            )
+            response.raise_for_status()
+
+            data = extract_production_data(response.text, plant_key)
+            if data:
+                _LOGGER.info(f"Successfully extracted data for {plant_key}")
+                return data
+            else:
+                _LOGGER.error(f"Failed to extract data from {plant_key}")
+                return None
+
+        except RequestException as e:
+            if self._closed:
+                _LOGGER.debug(f"Request for {plant_key} aborted: {e}")
+                return None
+            _LOGGER.error(f"Request error for {plant_key}: {e}")
+        except Exception as e:
+            _LOGGER.error(f"Unexpected error for {plant_key}: {e}")
+        return None
+
+    def fetch_okg_data(self, plant_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Fetch data from OKG O3 API."""
+        from requests import RequestException
+
+        try:
+            url = plant_config["url"]
+            _LOGGER.info(f"Fetching data from {url}")
+
+            # OKG API requires format parameter
+            response = self.get_session().get(
+                f"{url}?format=json", timeout=(CONNECT_TIMEOUT, REQUEST_TIMEOUT)
+            )
+            response.raise_for_status()
+
+            return normalize_okg_data(_JSON_DECODER.decode(response.text), plant_config)
+
+        except RequestException as e:
+            if self._closed:
+                _LOGGER.debug(f"Request for OKG aborted: {e}")
+                return None
+            _LOGGER.error(f"Request error for OKG: {e}")
+        except Exception as e:
+            _LOGGER.error(f"Unexpected error for OKG: {e}")
+        return None
+
+    def close(self) -> None:
+        """Cancel in-flight fetches and close the connection pools.
+
+        Must be called from the event loop when fetches may be in flight.
+        Requests already running in the executor are aborted by shutting
+        down their sockets, so worker threads don't linger until timeout.
+        """
+        self._closed = True
+        for task in list(self._inflight.values()):
+            task.cancel()
+        if self._adapter is not None:
+            self._adapter.abort()
+        if self.session is not None:
+            self.session.close()
+
+
+def extract_production_data(html_content: str, plant_name: str) -> Optional[Dict[str, Any]]:
+    """Extract production data from the JSON embedded in HTML."""
+    try:
+        # Look for JSON data in script tags
+        for match in _JSON_SCRIPT_RE.finditer(html_content):
+            try:
+                json_data = _JSON_DECODER.decode(match.group(1).strip())
+                if 'powerPlant' in json_data and 'blockProductionDataList' in json_data:
+                    if json_data['powerPlant'].lower() == plant_name.lower():
+                        return {
+                            'timestamp': json_data.get('timestamp'),
+                            'power_plant': json_data['powerPlant'],
+                            'data': json_data['blockProductionDataList']
+                        }
+            except json.JSONDecodeError:
+                continue
+
+        _LOGGER.warning(f"No valid JSON data found for {plant_name}")
+        return None
+
+    except Exception as e:
+        _LOGGER.error(f"Error extracting data for {plant_name}: {e}")
+        return None
+
+
+def normalize_okg_data(data: Dict[str, Any], plant_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Convert an OKG API response into the Vattenfall data layout."""
+    # Calculate percentage for O3 using max capacity
+    max_capacity = plant_config.get("max_capacity", {}).get("O3", 1450)
+    current_power = data.get('value', 0)
+    percentage = (current_power / max_capacity * 100) if max_capacity > 0 else 0
+
+    # OKG returns single reactor data
+    return {
+        'timestamp': data.get('timestamp'),
+        'power_plant': plant_config['name'],
+        'data': [{
+            'name': 'O3',
+            'production': current_power,
+            'percent': round(percentage, 1),
+            'unit': 'MW',
+            'valueDate': data.get('valueDate')
+        }]
+    }
+
+
+class FleetAggregates:
+    """Per-plant and fleet totals, updated incrementally as reactors change.
+
+    Each total holds the summed ``output`` in MW, the number of ``reactors``
+    with data and of ``active_reactors`` (producing power), and the
+    ``available_capacity`` (capacity of the active reactors) next to the
+    ``installed_capacity`` from the plant configuration.
+
+    Only the plants whose reactors changed are summed again. Their totals are
+    recomputed rather than adjusted by deltas, so float rounding errors don't
+    accumulate over long uptimes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.plants: Dict[str, Dict[str, float]] = {
+            plant_key: _empty_totals(sum(plant_config["max_capacity"].values()))
+            for plant_key, plant_config in PLANTS.items()
+        }
+        self.fleet = _empty_totals(
+            sum(totals["installed_capacity"] for totals in self.plants.values())
+        )
+        self._reactors: Dict[ReactorKey, Dict[str, Any]] = {}
+
+    def update(self, data: Optional[Dict[str, Any]]) -> None:
+        """Recompute the totals of the plants whose reactors changed."""
+        reactors = flatten_reactors(data)
+
+        changed_plants = {
+            key[0] for key, values in reactors.items() if self._reactors.get(key) != values
+        }
+        changed_plants.update(key[0] for key in self._reactors.keys() - reactors.keys())
+        self._reactors = reactors
+        if not changed_plants:
+            return
+
+        for plant_key in changed_plants:
+            contributions = [
+                _contribution(key, values)
+                for key, values in reactors.items()
+                if key[0] == plant_key
+            ]
+            self.plants[plant_key].update(_sum_contributions(contributions))
+
+        self.fleet.update(
+            _sum_contributions(
+                [
+                    tuple(totals[field] for field in _CONTRIBUTION_FIELDS)
+                    for totals in self.plants.values()
+                ]
+            )
+        )
+
+
+_CONTRIBUTION_FIELDS = ("output", "reactors", "active_reactors", "available_capacity")
+
+
+def _empty_totals(installed_capacity: float) -> Dict[str, float]:
+    """Return the totals of a plant (or the fleet) without data."""
+    return {
+        **dict.fromkeys(_CONTRIBUTION_FIELDS, 0),
+        "installed_capacity": installed_capacity,
+    }
+
+
+def _sum_contributions(contributions: List[Tuple[float, ...]]) -> Dict[str, float]:
+    """Sum contributions field by field."""
+    totals = dict.fromkeys(_CONTRIBUTION_FIELDS, 0)
+    for contribution in contributions:
+        for field, value in zip(_CONTRIBUTION_FIELDS, contribution):
+            totals[field] += value
+    return totals
+
+
+def _contribution(
+    key: ReactorKey, values: Optional[Dict[str, Any]]
+) -> Tuple[float, int, int, float]:
+    """Return a reactor's share of each total field."""
+    if values is None:
+        return (0, 0, 0, 0)
+
+    plant_key, reactor_name = key
+    production = values["production"] or 0
+    if production <= 0:
+        return (production, 1, 0, 0)
+    capacity = PLANTS[plant_key]["max_capacity"].get(reactor_name, 0)
+    return (production, 1, 1, capacity)
+
+
+def flatten_reactors(
+    data: Optional[Dict[str, Any]], plants: Optional[Iterable[str]] = None
+) -> Dict[ReactorKey, Dict[str, Any]]:
+    """Flatten plant data into compact per-reactor values."""
+    reactors = {}
+    if not data:
+        return reactors
+
+    for plant_key in PLANTS if plants is None else plants:
+        plant_data = data.get(plant_key)
+        if not plant_data:
+            continue
+        timestamp = plant_data.get("timestamp")
+        for reactor_data in plant_data.get("data", []):
+            reactors[(plant_key, reactor_data.get("name"))] = {
+                "production": reactor_data.get("production"),
+                "percent": reactor_data.get("percent"),
+                "value_date": reactor_data.get("valueDate"),
+                "timestamp": timestamp,
+            }
+
+    return reactors
+
+
+def diff_reactors(
+    old: Dict[ReactorKey, Dict[str, Any]], new: Dict[ReactorKey, Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """Return the reactors whose values changed between two flattened snapshots.
+
+    Reactors that disappeared (e.g. their plant failed to fetch) are reported
+    with all values set to None, matching what the sensors show.
+    """
+    changes = []
+
+    for key, values in new.items():
+        if old.get(key) != values:
+            changes.append(reactor_message(key, values))
+
+    for key in old.keys() - new.keys():
+        changes.append(reactor_message(key, dict.fromkeys(old[key])))
+
+    return changes
+
+
+def reactor_message(key: ReactorKey, values: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the message payload for a single reactor."""
+    plant_key, reactor_name = key
+    return {"plant": plant_key, "reactor": reactor_name, **values}
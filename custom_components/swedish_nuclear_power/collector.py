@@ -0,0 +1,129 @@
+"""Local snapshot collector for Swedish Nuclear Power.
+
+The collector polls the plants once per interval and serves the latest
+snapshot over a Unix domain socket, so several Home Assistant instances (or
+other consumers) on one host share a single upstream fetch. Like ``api.py``
+this module does not depend on Home Assistant.
+
+Protocol: a client connects, the collector writes one JSON line
+``{"seq": ..., "fetched_at": ..., "data": {...}}`` and closes the connection.
+``data`` has the same layout as the coordinator data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import stat
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from .api import REQUEST_TIMEOUT, ExecutorJob, NuclearPowerClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Upper bound for a single snapshot line
+MAX_SNAPSHOT_SIZE = 2**20
+
+
+class SnapshotCollector:
+    """Poll the plants and serve the latest snapshot over a Unix socket."""
+
+    def __init__(
+        self,
+        client: NuclearPowerClient,
+        socket_path: str,
+        interval: float,
+        executor_job: Optional[ExecutorJob] = None,
+    ) -> None:
+        """Initialize."""
+        self.client = client
+        self.socket_path = socket_path
+        self.interval = interval
+        self.seq = 0
+        self._executor_job = executor_job
+        self._payload = b""
+
+    async def async_poll(self) -> None:
+        """Fetch all plants and publish the result as the current snapshot."""
+        data = await self.client.async_fetch_all_plants(self._executor_job)
+        self.seq += 1
+        # Encode once per poll; every client gets the same bytes
+        self._payload = (
+            json.dumps(
+                {
+                    "seq": self.seq,
+                    "fetched_at": datetime.now(timezone.utc).isoformat(),
+                    "data": data,
+                },
+                separators=(",", ":"),
+            )
+            + "\n"
+        ).encode()
+        _LOGGER.info(f"Published snapshot {self.seq} with {len(data)} plants")
+
+    async def _async_handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Send the current snapshot to a connected client."""
+        try:
+            writer.write(self._payload)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def async_run(self) -> None:
+        """Serve snapshots until cancelled."""
+        loop = asyncio.get_running_loop()
+        next_poll = loop.time() + self.interval
+        await self.async_poll()
+
+        _remove_stale_socket(self.socket_path)
+        server = await asyncio.start_unix_server(
+            self._async_handle_client, path=self.socket_path
+        )
+        _LOGGER.info(f"Serving snapshots on {self.socket_path}")
+
+        try:
+            async with server:
+                while True:
+                    await asyncio.sleep(max(0, next_poll - loop.time()))
+                    next_poll = loop.time() + self.interval
+                    try:
+                        await self.async_poll()
+                    except Exception as e:
+                        _LOGGER.warning(f"Failed to poll plants: {e}")
+        finally:
+            _remove_stale_socket(self.socket_path)
+
+
+async def async_read_snapshot(
+    socket_path: str,
+    timeout: float = REQUEST_TIMEOUT,
+    decode: Callable[[bytes], Dict[str, Any]] = json.loads,
+) -> Dict[str, Any]:
+    """Read the latest snapshot from a running collector and ``decode`` it."""
+    reader, writer = await asyncio.wait_for(
+        asyncio.open_unix_connection(socket_path, limit=MAX_SNAPSHOT_SIZE), timeout
+    )
+    try:
+        line = await asyncio.wait_for(reader.readline(), timeout)
+    finally:
+        writer.close()
+
+    if not line:
+        raise ValueError(f"Collector at {socket_path} has no snapshot yet")
+    return decode(line)
+
+
+def _remove_stale_socket(socket_path: str) -> None:
+    """Remove a socket file left behind by a previous collector."""
+    try:
+        if stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            os.unlink(socket_path)
+    except FileNotFoundError:
+        pass
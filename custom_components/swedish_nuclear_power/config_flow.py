@@ -6,11 +6,28 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigFlow, ConfigFlowResult
+from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.helpers.selector import NumberSelector, NumberSelectorConfig
+from homeassistant.core import callback
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+)
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
+from .const import (
+    CONF_COLLECTOR_SOCKET,
+    CONF_SOURCE,
+    DEFAULT_COLLECTOR_SOCKET,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    SOURCE_INTERNET,
+    SOURCES,
+)
+from .options import SwedishNuclearPowerOptionsFlow
 
 
 class SwedishNuclearPowerConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -18,6 +35,14 @@ class SwedishNuclearPowerConfigFlow(ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> SwedishNuclearPowerOptionsFlow:
+        """Get the options flow for this handler."""
+        return SwedishNuclearPowerOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -44,6 +69,20 @@ class SwedishNuclearPowerConfigFlow(ConfigFlow, domain=DOMAIN):
                             mode="slider",
                         )
                     ),
+                    vol.Optional(
+                        CONF_SOURCE,
+                        default=SOURCE_INTERNET,
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=SOURCES,
+                            translation_key=CONF_SOURCE,
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_COLLECTOR_SOCKET,
+                        default=DEFAULT_COLLECTOR_SOCKET,
+                    ): TextSelector(),
                 }
             ),
         )
\ No newline at end of file
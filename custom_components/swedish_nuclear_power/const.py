@@ -4,10 +4,37 @@ from __future__ import annotations
 
 DOMAIN = "swedish_nuclear_power"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_SOURCE = "source"
+CONF_COLLECTOR_SOCKET = "collector_socket"
+
+# Data sources
+SOURCE_INTERNET = "internet"
+SOURCE_COLLECTOR = "local_collector"
+SOURCES = [SOURCE_INTERNET, SOURCE_COLLECTOR]
 
 # Default scan interval in seconds
 DEFAULT_SCAN_INTERVAL = 60
 
+# Default Unix socket of the local collector
+DEFAULT_COLLECTOR_SOCKET = "/tmp/swedish_nuclear_power.sock"
+
+# Collector snapshots older than this many scan intervals are rejected
+COLLECTOR_MAX_AGE_INTERVALS = 3
+
+# Default age in seconds below which a targeted refresh reuses the current data
+DEFAULT_REFRESH_MAX_AGE = 10
+
+# Default window in seconds over which websocket deltas are coalesced
+DEFAULT_COALESCE_WINDOW = 1.0
+
+# Dispatched with the entry ID when a config entry unloads
+SIGNAL_ENTRY_UNLOADED = f"{DOMAIN}_entry_unloaded"
+
+# Output formats of the profile service
+PROFILE_FORMAT_PSTATS = "pstats"
+PROFILE_FORMAT_COLLAPSED = "collapsed"
+PROFILE_FORMATS = [PROFILE_FORMAT_PSTATS, PROFILE_FORMAT_COLLAPSED]
+
 # Plant configurations
 PLANTS = {
     "ringhals": {
@@ -2,19 +2,28 @@
 
 from __future__ import annotations
 
-import asyncio
+import functools
 import json
 import logging
-import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
 
-import requests
-
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .api import ExecutorJob, FleetAggregates, NuclearPowerClient
+from .collector import async_read_snapshot
+from .const import (
+    COLLECTOR_MAX_AGE_INTERVALS,
+    DEFAULT_COLLECTOR_SOCKET,
+    SOURCE_COLLECTOR,
+    SOURCE_INTERNET,
+)
 
-from .const import PLANTS, DOMAIN
+if TYPE_CHECKING:
+    from .profiler import RefreshProfiler
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,7 +31,13 @@ _LOGGER = logging.getLogger(__name__)
 class SwedishNuclearPowerCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from Swedish nuclear power plants."""
 
-    def __init__(self, hass: HomeAssistant, scan_interval: int) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        scan_interval: int,
+        source: str = SOURCE_INTERNET,
+        collector_socket: str = DEFAULT_COLLECTOR_SOCKET,
+    ) -> None:
         """Initialize."""
         super().__init__(
             hass,
@@ -30,124 +45,146 @@ class SwedishNuclearPowerCoordinator(DataUpdateCoordinator):
             name="Swedish Nuclear Power",
             update_interval=timedelta(seconds=scan_interval),
         )
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
+        self.source = source
+        self.collector_socket = collector_socket
+        self.client = NuclearPowerClient()
+        self.aggregates = FleetAggregates()
+        # Only set while the profile service is running
+        self.profiler: Optional[RefreshProfiler] = None
+        # Set on shutdown, after which refreshes return without fetching
+        self.closed = False
 
     async def _async_update_data(self) -> Dict[str, Any]:
         """Update data via library."""
+        if (profiler := self.profiler) is None:
+            return await self._async_fetch_data(self.hass.async_add_executor_job)
+
+        try:
+            return await self._async_fetch_data(
+                profiler.wrap_executor_job(self.hass.async_add_executor_job)
+            )
+        finally:
+            profiler.cycle_done()
+
+    async def _async_fetch_data(self, executor_job: ExecutorJob) -> Dict[str, Any]:
+        """Fetch data from the configured source."""
+        if self.source == SOURCE_COLLECTOR:
+            return await self._async_update_from_collector()
+
         try:
-            # Use asyncio to run the synchronous requests in an executor
-            data = await self.hass.async_add_executor_job(self._fetch_all_plants)
-            return data
+            # The client runs the synchronous requests in the executor
+            data = await self.client.async_fetch_all_plants(executor_job)
         except Exception as exception:
             raise UpdateFailed(f"Error communicating with nuclear plants: {exception}")
+        if self.closed:
+            raise UpdateFailed("Shut down while fetching from the nuclear plants")
+        return data
 
-    def _fetch_all_plants(self) -> Dict[str, Any]:
-        """Fetch data from all nuclear plants."""
-        all_data = {}
-        
-        for plant_key, plant_config in PLANTS.items():
-            try:
-                if plant_config.get("api", False):
-                    # O3 API call
-                    data = self._fetch_okg_data(plant_config)
-                else:
-                    # Vattenfall scraping
-                    data = self._fetch_vattenfall_data(plant_key, plant_config)
-                
-                if data:
-                    all_data[plant_key] = data
-                    
-            except Exception as e:
-                _LOGGER.warning(f"Failed to fetch data from {plant_config['name']}: {e}")
-                continue
-        
-        return all_data
-
-    def _fetch_vattenfall_data(self, plant_key: str, plant_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Fetch data from Vattenfall plants (Ringhals, Forsmark)."""
-        try:
-            url = plant_config["url"]
-            _LOGGER.info(f"Fetching data from {url}")
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = self._extract_production_data(response.text, plant_key)
-            if data:
-                _LOGGER.info(f"Successfully extracted data for {plant_key}")
-                return data
+    async def async_refresh_plants(
+        self, plants: Iterable[str], max_age: float
+    ) -> Dict[str, List[str]]:
+        """Refresh only the given plants, unless their data is recent enough.
+
+        Fetches for a plant that is already being fetched are joined rather
+        than repeated. Returns which plants were fetched, which failed and
+        which were served from the current data.
+        """
+        plants = list(plants)
+        if self.source == SOURCE_COLLECTOR:
+            # The collector always serves the full snapshot
+            await self.async_refresh()
+            if self.last_update_success:
+                return {"fetched": plants, "failed": [], "cached": []}
+            return {"fetched": [], "failed": plants, "cached": []}
+
+        # A plant without data (e.g. its last fetch failed) is always stale
+        current = self.data or {}
+        stale = [
+            plant
+            for plant in plants
+            if plant not in current or self.client.fetch_age(plant) >= max_age
+        ]
+        cached = [plant for plant in plants if plant not in stale]
+        if not stale:
+            return {"fetched": [], "failed": [], "cached": cached}
+
+        fetched = await self.client.async_fetch_all_plants(
+            self.hass.async_add_executor_job, stale
+        )
+        if self.closed:
+            raise HomeAssistantError("Swedish Nuclear Power was unloaded while refreshing")
+        data = dict(self.data or {})
+        for plant in stale:
+            if plant in fetched:
+                data[plant] = fetched[plant]
             else:
-                _LOGGER.error(f"Failed to extract data from {plant_key}")
-                return None
-                
-        except requests.RequestException as e:
-            _LOGGER.error(f"Request error for {plant_key}: {e}")
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error for {plant_key}: {e}")
-            return None
-
-    def _extract_production_data(self, html_content: str, plant_name: str) -> Optional[Dict[str, Any]]:
-        """Extract production data from the JSON embedded in HTML."""
+                # Same as a full refresh: a plant that failed has no data
+                data.pop(plant, None)
+
+        # Unlike async_set_updated_data this keeps the regular refresh
+        # schedule, so refreshing one plant doesn't delay the others.
+        self.data = data
+        if fetched:
+            self.last_update_success = True
+        self.async_update_listeners()
+        return {
+            "fetched": [plant for plant in stale if plant in fetched],
+            "failed": [plant for plant in stale if plant not in fetched],
+            "cached": cached,
+        }
+
+    async def async_shutdown(self) -> None:
+        """Stop scheduled refreshes, cancel in-flight fetches and close the session."""
+        self.closed = True
+        if self.profiler is not None:
+            self.profiler.cancel()
+        await super().async_shutdown()
+        self.client.close()
+
+    async def _async_update_from_collector(self) -> Dict[str, Any]:
+        """Read the latest snapshot from the local collector.
+
+        Snapshots older than a few scan intervals are rejected, so a stuck
+        collector makes the sensors unavailable instead of frozen.
+        """
+        if (profiler := self.profiler) is None:
+            decode = json.loads
+        else:
+            decode = functools.partial(profiler.run, json.loads)
+
         try:
-            # Look for JSON data in script tags
-            pattern = r'<script[^>]*type="application/json"[^>]*>(.*?)</script>'
-            matches = re.findall(pattern, html_content, re.DOTALL)
-            
-            for match in matches:
-                try:
-                    json_data = json.loads(match.strip())
-                    if 'powerPlant' in json_data and 'blockProductionDataList' in json_data:
-                        if json_data['powerPlant'].lower() == plant_name.lower():
-                            return {
-                                'timestamp': json_data.get('timestamp'),
-                                'power_plant': json_data['powerPlant'],
-                                'data': json_data['blockProductionDataList']
-                            }
-                except json.JSONDecodeError:
-                    continue
-            
-            _LOGGER.warning(f"No valid JSON data found for {plant_name}")
-            return None
-            
-        except Exception as e:
-            _LOGGER.error(f"Error extracting data for {plant_name}: {e}")
-            return None
-
-    def _fetch_okg_data(self, plant_config: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Fetch data from OKG O3 API."""
+            snapshot = await async_read_snapshot(self.collector_socket, decode=decode)
+        except Exception as exception:
+            raise UpdateFailed(
+                f"Error communicating with local collector at {self.collector_socket}: {exception}"
+            )
+
         try:
-            url = plant_config["url"]
-            _LOGGER.info(f"Fetching data from {url}")
-            
-            # OKG API requires format parameter
-            response = self.session.get(f"{url}?format=json", timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Calculate percentage for O3 using max capacity
-            max_capacity = plant_config.get("max_capacity", {}).get("O3", 1450)
-            current_power = data.get('value', 0)
-            percentage = (current_power / max_capacity * 100) if max_capacity > 0 else 0
-            
-            # OKG returns single reactor data
-            return {
-                'timestamp': data.get('timestamp'),
-                'power_plant': plant_config['name'],
-                'data': [{
-                    'name': 'O3',
-                    'production': current_power,
-                    'percent': round(percentage, 1),
-                    'unit': 'MW',
-                    'valueDate': data.get('valueDate')
-                }]
-            }
-            
-        except requests.RequestException as e:
-            _LOGGER.error(f"Request error for OKG: {e}")
-        except Exception as e:
-            _LOGGER.error(f"Unexpected error for OKG: {e}")
-            return None
\ No newline at end of file
+            fetched_at = dt_util.parse_datetime(snapshot["fetched_at"], raise_on_error=True)
+            age = dt_util.utcnow() - fetched_at
+        except (KeyError, TypeError, ValueError) as exception:
+            raise UpdateFailed(
+                f"Invalid snapshot {snapshot.get('seq')} from local collector: {exception}"
+            )
+        if age > self.update_interval * COLLECTOR_MAX_AGE_INTERVALS:
+            raise UpdateFailed(
+                f"Snapshot {snapshot.get('seq')} from local collector is stale "
+                f"(fetched {age.total_seconds():.0f} seconds ago)"
+            )
+        return snapshot["data"]
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the aggregates and all registered listeners.
+
+        The state writes are profiled when the profile service is running.
+        """
+        if (profiler := self.profiler) is None:
+            self._update_aggregates_and_listeners()
+        else:
+            profiler.run(self._update_aggregates_and_listeners)
+
+    def _update_aggregates_and_listeners(self) -> None:
+        """Update the aggregates, then write the states of the listeners."""
+        self.aggregates.update(self.data)
+        super().async_update_listeners()
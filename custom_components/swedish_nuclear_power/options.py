@@ -6,20 +6,30 @@ from typing import Any
 
 import voluptuous as vol
 
-from homeassistant.config_entries import ConfigEntry, OptionsFlow
+from homeassistant.config_entries import ConfigFlowResult, OptionsFlow
 from homeassistant.const import CONF_SCAN_INTERVAL
-from homeassistant.helpers.selector import NumberSelector, NumberSelectorConfig
+from homeassistant.helpers.selector import (
+    NumberSelector,
+    NumberSelectorConfig,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
+)
 
-from .const import DEFAULT_SCAN_INTERVAL
+from .const import (
+    CONF_COLLECTOR_SOCKET,
+    CONF_SOURCE,
+    DEFAULT_COLLECTOR_SOCKET,
+    DEFAULT_SCAN_INTERVAL,
+    SOURCE_INTERNET,
+    SOURCES,
+)
 
 
 class SwedishNuclearPowerOptionsFlow(OptionsFlow):
     """Handle options flow for Swedish Nuclear Power."""
 
-    def __init__(self, config_entry: ConfigEntry) -> None:
-        """Initialize options flow."""
-        self.config_entry = config_entry
-
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -31,7 +41,15 @@ class SwedishNuclearPowerOptionsFlow(OptionsFlow):
             )
 
         scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+            CONF_SCAN_INTERVAL,
+            self.config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        )
+        source = self.config_entry.options.get(
+            CONF_SOURCE, self.config_entry.data.get(CONF_SOURCE, SOURCE_INTERNET)
+        )
+        collector_socket = self.config_entry.options.get(
+            CONF_COLLECTOR_SOCKET,
+            self.config_entry.data.get(CONF_COLLECTOR_SOCKET, DEFAULT_COLLECTOR_SOCKET),
         )
 
         return self.async_show_form(
@@ -50,6 +68,20 @@ class SwedishNuclearPowerOptionsFlow(OptionsFlow):
                             mode="slider",
                         )
                     ),
+                    vol.Optional(
+                        CONF_SOURCE,
+                        default=source,
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=SOURCES,
+                            translation_key=CONF_SOURCE,
+                            mode=SelectSelectorMode.DROPDOWN,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_COLLECTOR_SOCKET,
+                        default=collector_socket,
+                    ): TextSelector(),
                 }
             ),
         )
\ No newline at end of file
@@ -0,0 +1,320 @@
+"""Refresh cycle profiling for Swedish Nuclear Power integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import pstats
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .api import ExecutorJob
+from .const import PROFILE_FORMAT_PSTATS
+
+_LOGGER = logging.getLogger(__name__)
+
+# Every call is profiled in the thread that makes it, so the event loop and
+# the executor jobs never share a call stack. cProfile is per thread before
+# Python 3.12. Since then it is built on sys.monitoring, which reports the
+# events of all threads to a single active profiler, and the pure-Python
+# profile module breaks when several threads use it at once. On 3.12+ the
+# profiler below filters the sys.monitoring events by thread instead. Its
+# callbacks are Python code, so it inflates the times of Python-heavy code
+# more than cProfile does; compare them relatively.
+if sys.version_info < (3, 12):
+    from cProfile import Profile as _new_profile
+
+else:
+    import types
+
+    # Callables that cProfile reports as builtins
+    _BUILTIN_TYPES = (
+        types.BuiltinFunctionType,
+        types.MethodDescriptorType,
+        types.ClassMethodDescriptorType,
+    )
+
+    class _ThreadProfile:
+        """Profile the calls of one thread, with the layout of cProfile stats."""
+
+        def __init__(self) -> None:
+            """Initialize."""
+            # pstats layout: {func: [primitive calls, calls, tottime, cumtime, callers]}
+            self.stats: Dict[tuple, Any] = {}
+            # Entries of [func, code or callable, started, time in callees]
+            self._stack: List[list] = []
+            self._active: Dict[tuple, int] = {}
+
+        def runcall(self, target: Callable[..., Any], *args: Any) -> Any:
+            """Run a call with this profiler active in the calling thread."""
+            if (thread := _MONITOR.start(self)) is None:
+                return target(*args)
+            try:
+                return target(*args)
+            finally:
+                _MONITOR.stop(thread)
+
+        def create_stats(self) -> None:
+            """Convert the statistics to the tuples pstats expects."""
+            self.stats = {
+                func: (*totals[:4], {caller: tuple(edge) for caller, edge in totals[4].items()})
+                for func, totals in self.stats.items()
+            }
+
+        def enter(self, func: tuple, frame_id: Any) -> None:
+            """Record the start of a call."""
+            self._active[func] = self._active.get(func, 0) + 1
+            self._stack.append([func, frame_id, time.perf_counter(), 0.0])
+
+        def leave(self, frame_id: Any) -> None:
+            """Record the end of the innermost call, if it is the one that ends."""
+            # Calls that started before the profiler are not on the stack
+            if not self._stack or self._stack[-1][1] is not frame_id:
+                return
+            func, _, started, callees = self._stack.pop()
+            elapsed = time.perf_counter() - started
+            self._active[func] -= 1
+            # Like cProfile, only the outermost of recursive calls adds cumtime
+            outermost = not self._active[func]
+
+            totals = self.stats.setdefault(func, [0, 0, 0.0, 0.0, {}])
+            totals[0] += outermost
+            totals[1] += 1
+            totals[2] += elapsed - callees
+            totals[3] += elapsed if outermost else 0.0
+            if not self._stack:
+                return
+            caller = self._stack[-1]
+            caller[3] += elapsed
+            # Caller entries count all calls first, then the primitive ones
+            edge = totals[4].setdefault(caller[0], [0, 0, 0.0, 0.0])
+            edge[0] += 1
+            edge[1] += outermost
+            edge[2] += elapsed - callees
+            edge[3] += elapsed if outermost else 0.0
+
+    class _Monitor:
+        """Dispatch sys.monitoring events to the profiler of their thread."""
+
+        def __init__(self) -> None:
+            """Initialize."""
+            self._profiles: Dict[int, _ThreadProfile] = {}
+            # Threads with an active profiler, which keep the events enabled
+            self._threads = 0
+            self._lock = threading.Lock()
+
+        def start(self, profile: _ThreadProfile) -> Optional[int]:
+            """Activate a profiler in the calling thread, if it has none yet.
+
+            Returns the thread to pass to stop(), or None if not profiling.
+            """
+            thread = threading.get_ident()
+            if thread in self._profiles:
+                return None
+            monitoring = sys.monitoring
+            with self._lock:
+                if not self._threads:
+                    try:
+                        monitoring.use_tool_id(monitoring.PROFILER_ID, "swedish_nuclear_power")
+                    except ValueError:
+                        _LOGGER.warning("Not profiling, another profiler is active")
+                        return None
+                    self._register(True)
+                self._threads += 1
+            # Set last and removed first, so the profile doesn't see the monitor
+            self._profiles[thread] = profile
+            return thread
+
+        def stop(self, thread: int) -> None:
+            """Deactivate the profiler of a thread started with start()."""
+            del self._profiles[thread]
+            with self._lock:
+                self._threads -= 1
+                if not self._threads:
+                    self._register(False)
+                    sys.monitoring.free_tool_id(sys.monitoring.PROFILER_ID)
+
+        def _register(self, enable: bool) -> None:
+            """Enable or disable the callbacks."""
+            monitoring = sys.monitoring
+            callbacks = {
+                monitoring.events.PY_START: self._py_start,
+                monitoring.events.PY_RESUME: self._py_start,
+                monitoring.events.PY_RETURN: self._py_return,
+                monitoring.events.PY_YIELD: self._py_return,
+                monitoring.events.PY_UNWIND: self._py_return,
+                monitoring.events.CALL: self._call,
+                monitoring.events.C_RETURN: self._c_return,
+                monitoring.events.C_RAISE: self._c_return,
+            }
+            for event, function in callbacks.items():
+                monitoring.register_callback(
+                    monitoring.PROFILER_ID, event, function if enable else None
+                )
+            monitoring.set_events(monitoring.PROFILER_ID, sum(callbacks) if enable else 0)
+
+        # The callbacks run in the thread of the event
+
+        def _py_start(self, code: Any, offset: int) -> None:
+            if profile := self._profiles.get(threading.get_ident()):
+                profile.enter((code.co_filename, code.co_firstlineno, code.co_name), code)
+
+        def _py_return(self, code: Any, offset: int, value: Any) -> None:
+            if profile := self._profiles.get(threading.get_ident()):
+                profile.leave(code)
+
+        def _call(self, code: Any, offset: int, func: Any, arg0: Any) -> None:
+            if not isinstance(func, _BUILTIN_TYPES):
+                return
+            if profile := self._profiles.get(threading.get_ident()):
+                profile.enter(("~", 0, _builtin_label(func)), func)
+
+        def _c_return(self, code: Any, offset: int, func: Any, arg0: Any) -> None:
+            if profile := self._profiles.get(threading.get_ident()):
+                profile.leave(func)
+
+    def _builtin_label(func: Any) -> str:
+        """Name a builtin the way cProfile does."""
+        if isinstance(func, types.BuiltinFunctionType) and (
+            owner := getattr(func, "__self__", None)
+        ) is not None and not isinstance(owner, types.ModuleType):
+            return f"<method '{func.__name__}' of '{type(owner).__qualname__}' objects>"
+        if isinstance(func, types.BuiltinFunctionType):
+            if func.__module__ is None:
+                return f"<built-in method {func.__name__}>"
+            return f"<built-in method {func.__module__}.{func.__name__}>"
+        return f"<method '{func.__name__}' of '{func.__objclass__.__qualname__}' objects>"
+
+    _MONITOR = _Monitor()
+    _new_profile = _ThreadProfile
+
+
+class RefreshProfiler:
+    """Profile the next refresh cycles of a coordinator.
+
+    The coordinator only holds a profiler while one is requested, so regular
+    refreshes pay nothing but an attribute check. Only synchronous code is
+    profiled: the executor jobs and the event loop sections that process
+    their results, never the awaits between them.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize."""
+        self.remaining = cycles
+        self.cycles = 0
+        self._profiles: List[Any] = []
+        self._lock = threading.Lock()
+        # Set when all cycles are profiled, or when the coordinator shuts down
+        self.finished = asyncio.Event()
+
+    @property
+    def done(self) -> bool:
+        """Return True when all requested cycles have been profiled."""
+        return self.remaining <= 0
+
+    def run(self, target: Callable[..., Any], *args: Any) -> Any:
+        """Run a synchronous call under its own profiler, in the calling thread."""
+        profile = _new_profile()
+        try:
+            return profile.runcall(target, *args)
+        finally:
+            with self._lock:
+                self._profiles.append(profile)
+
+    def wrap_executor_job(self, executor_job: ExecutorJob) -> ExecutorJob:
+        """Return an executor job callable that profiles each job in its worker."""
+
+        def profiled_executor_job(target: Callable[..., Any], *args: Any) -> Any:
+            return executor_job(self.run, target, *args)
+
+        return profiled_executor_job
+
+    def cycle_done(self) -> None:
+        """Record that a refresh cycle has finished."""
+        self.cycles += 1
+        self.remaining -= 1
+        if self.done:
+            self.finished.set()
+
+    def cancel(self) -> None:
+        """Stop waiting for the remaining cycles."""
+        self.finished.set()
+
+    def report(self, path: str, output_format: str, top: int) -> Dict[str, Any]:
+        """Write the statistics and return the top functions.
+
+        Merging and sorting the statistics takes a while for large profiles,
+        so this runs in the executor.
+        """
+        stats = self.stats()
+        self.write(stats, path, output_format)
+        return self.summary(stats, top)
+
+    def stats(self) -> pstats.Stats:
+        """Return the merged statistics of all profiled cycles."""
+        stats = pstats.Stats()
+        with self._lock:
+            for profile in self._profiles:
+                stats.add(profile)
+        return stats
+
+    def summary(self, stats: pstats.Stats, top: int) -> Dict[str, Any]:
+        """Return the top functions by cumulative time."""
+        rows = sorted(
+            stats.stats.items(), key=lambda item: item[1][3], reverse=True
+        )[:top]
+        return {
+            "cycles": self.cycles,
+            "total_time": round(stats.total_tt, 6),
+            "functions": [
+                {
+                    "function": _label(func),
+                    "calls": calls,
+                    "tottime": round(tottime, 6),
+                    "cumtime": round(cumtime, 6),
+                }
+                for func, (_, calls, tottime, cumtime, _) in rows
+            ],
+        }
+
+    def write(self, stats: pstats.Stats, path: str, output_format: str) -> None:
+        """Write the statistics as pstats or collapsed stacks."""
+        if output_format == PROFILE_FORMAT_PSTATS:
+            stats.dump_stats(path)
+            return
+
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, microseconds in collapsed_stacks(stats):
+                file.write(f"{stack} {microseconds}\n")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> Iterator[tuple[str, int]]:
+    """Yield flamegraph collapsed stacks from profile statistics.
+
+    The profilers only record direct callers, so each function's own time is
+    attributed to the path through its most expensive caller at every level.
+    """
+    for func, (_, _, tottime, _, _) in stats.stats.items():
+        microseconds = int(tottime * 1_000_000)
+        if microseconds <= 0:
+            continue
+
+        stack = [func]
+        while callers := stats.stats[stack[-1]][4]:
+            caller = max(callers, key=lambda c: callers[c][3])
+            if caller in stack or caller not in stats.stats:
+                break
+            stack.append(caller)
+
+        yield ";".join(_label(frame) for frame in reversed(stack)), microseconds
+
+
+def _label(func: tuple[str, int, str]) -> str:
+    """Format a pstats function key."""
+    filename, lineno, name = func
+    if filename == "~":
+        return name
+    return f"{os.path.basename(filename)}:{lineno}({name})"
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 from datetime import datetime
-from dateutil import parser as dateparser
 from typing import Any, Dict, List
 
 from homeassistant.components.sensor import (
@@ -16,8 +15,9 @@ from homeassistant.const import UnitOfPower
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, PLANTS
+from .const import DEFAULT_REFRESH_MAX_AGE, DOMAIN, PLANTS
 from .coordinator import SwedishNuclearPowerCoordinator
 
 # Sensor descriptions
@@ -37,6 +37,15 @@ TIMESTAMP_SENSOR_DESCRIPTION = SensorEntityDescription(
     icon="mdi:clock",
 )
 
+PLANT_TOTAL_POWER_SENSOR_DESCRIPTION = SensorEntityDescription(
+    key="plant_total_power",
+    name="Total Power",
+    native_unit_of_measurement=UnitOfPower.MEGA_WATT,
+    device_class=SensorDeviceClass.POWER,
+    state_class=SensorStateClass.MEASUREMENT,
+    icon="mdi:reactor",
+)
+
 TOTAL_POWER_SENSOR_DESCRIPTION = SensorEntityDescription(
     key="total_power",
     name="Total Swedish Nuclear Power",
@@ -68,6 +77,15 @@ async def async_setup_entry(
                 )
             )
         
+        # Add total power sensor for each plant
+        entities.append(
+            PlantTotalPowerSensor(
+                coordinator,
+                plant_key,
+                PLANT_TOTAL_POWER_SENSOR_DESCRIPTION,
+            )
+        )
+        
         # Add last update sensor for each plant
         entities.append(
             NuclearPowerSensor(
@@ -86,23 +104,54 @@ async def async_setup_entry(
     async_add_entities(entities)
 
 
-class NuclearPowerSensor(CoordinatorEntity, SensorEntity):
-    """Representation of a Nuclear Power sensor."""
+class PlantSensor(CoordinatorEntity, SensorEntity):
+    """Base class for the sensors of one plant."""
 
     def __init__(
         self,
         coordinator: SwedishNuclearPowerCoordinator,
         plant_key: str,
-        reactor_name: str,
         description: SensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
         self.coordinator = coordinator
         self.plant_key = plant_key
-        self.reactor_name = reactor_name
         self.entity_description = description
         self.plant_config = PLANTS[plant_key]
+
+    async def async_update(self) -> None:
+        """Refresh only this sensor's plant (homeassistant.update_entity)."""
+        if not self.enabled:
+            return
+        await self.coordinator.async_refresh_plants(
+            [self.plant_key], DEFAULT_REFRESH_MAX_AGE
+        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.plant_key)},
+            name=self.plant_config["name"],
+            manufacturer="Swedish Nuclear Power Plants",
+            model=f"{self.plant_config['name']} Nuclear Power Plant",
+        )
+
+
+class NuclearPowerSensor(PlantSensor):
+    """Representation of a Nuclear Power sensor."""
+
+    def __init__(
+        self,
+        coordinator: SwedishNuclearPowerCoordinator,
+        plant_key: str,
+        reactor_name: str,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, plant_key, description)
+        self.reactor_name = reactor_name
         
         # Set unique ID and name
         if reactor_name == plant_key:
@@ -128,7 +177,7 @@ class NuclearPowerSensor(CoordinatorEntity, SensorEntity):
             timestamp_str = plant_data.get("timestamp")
             if timestamp_str:
                 try:
-                    return dateparser.parse(timestamp_str)
+                    return dt_util.parse_datetime(timestamp_str)
                 except (ValueError, TypeError):
                     return None
             return None
@@ -162,15 +211,38 @@ class NuclearPowerSensor(CoordinatorEntity, SensorEntity):
         
         return {}
 
+
+class PlantTotalPowerSensor(PlantSensor):
+    """Representation of the total power output of one plant."""
+
+    def __init__(
+        self,
+        coordinator: SwedishNuclearPowerCoordinator,
+        plant_key: str,
+        description: SensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, plant_key, description)
+        self._attr_unique_id = f"{DOMAIN}_{plant_key}_total_power"
+        self._attr_name = f"{self.plant_config['name']} Total Power"
+
     @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.plant_key)},
-            name=self.plant_config["name"],
-            manufacturer="Swedish Nuclear Power Plants",
-            model=f"{self.plant_config['name']} Nuclear Power Plant",
-        )
+    def native_value(self) -> Any:
+        """Return the plant's total power output."""
+        data = self.coordinator.data
+        if not data or self.plant_key not in data:
+            return None
+        
+        return round(self.coordinator.aggregates.plants[self.plant_key]["output"], 2)
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return additional state attributes."""
+        data = self.coordinator.data
+        if not data or self.plant_key not in data:
+            return {}
+        
+        return _aggregate_attributes(self.coordinator.aggregates.plants[self.plant_key])
 
 
 class TotalNuclearPowerSensor(CoordinatorEntity, SensorEntity):
@@ -191,41 +263,28 @@ class TotalNuclearPowerSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self) -> Any:
         """Return the total power output."""
-        data = self.coordinator.data
-        if not data:
+        if not self.coordinator.data:
             return None
         
-        total_power = 0
-        
-        for plant_key, plant_data in data.items():
-            for reactor_data in plant_data.get("data", []):
-                total_power += reactor_data.get("production", 0)
-        
-        return round(total_power, 2)
+        return round(self.coordinator.aggregates.fleet["output"], 2)
 
     @property
     def extra_state_attributes(self) -> Dict[str, Any]:
         """Return additional state attributes."""
-        data = self.coordinator.data
-        if not data:
+        if not self.coordinator.data:
             return {}
         
-        attrs = {}
-        reactor_count = 0
-        active_reactors = 0
-        
-        for plant_key, plant_data in data.items():
-            for reactor_data in plant_data.get("data", []):
-                reactor_count += 1
-                if reactor_data.get("production", 0) > 0:
-                    active_reactors += 1
-        
-        attrs["total_reactors"] = reactor_count
-        attrs["active_reactors"] = active_reactors
+        attrs = _aggregate_attributes(self.coordinator.aggregates.fleet)
         attrs["last_updated"] = datetime.now().isoformat()
         
         return attrs
 
+    async def async_update(self) -> None:
+        """Refresh all plants unless recently fetched (homeassistant.update_entity)."""
+        if not self.enabled:
+            return
+        await self.coordinator.async_refresh_plants(PLANTS, DEFAULT_REFRESH_MAX_AGE)
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -234,4 +293,14 @@ class TotalNuclearPowerSensor(CoordinatorEntity, SensorEntity):
             name="Swedish Nuclear Power",
             manufacturer="Swedish Nuclear Power Plants",
             model="National Power Grid",
-        )
\ No newline at end of file
+        )
+
+
+def _aggregate_attributes(totals: Dict[str, float]) -> Dict[str, Any]:
+    """Return the state attributes for plant or fleet totals."""
+    return {
+        "total_reactors": totals["reactors"],
+        "active_reactors": totals["active_reactors"],
+        "available_capacity": totals["available_capacity"],
+        "installed_capacity": totals["installed_capacity"],
+    }
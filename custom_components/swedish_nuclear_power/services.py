@@ -0,0 +1,156 @@
+"""Services for Swedish Nuclear Power integration."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+import voluptuous as vol
+
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+    callback,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .api import REQUEST_TIMEOUT
+from .const import (
+    DEFAULT_REFRESH_MAX_AGE,
+    DOMAIN,
+    PLANTS,
+    PROFILE_FORMAT_PSTATS,
+    PROFILE_FORMATS,
+)
+from .coordinator import SwedishNuclearPowerCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_PROFILE = "profile"
+SERVICE_REFRESH = "refresh"
+
+ATTR_ENTRY_ID = "entry_id"
+ATTR_PLANTS = "plants"
+ATTR_MAX_AGE = "max_age"
+ATTR_CYCLES = "cycles"
+ATTR_FORMAT = "format"
+ATTR_TOP = "top"
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): str,
+        vol.Optional(ATTR_CYCLES, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=100)
+        ),
+        vol.Optional(ATTR_FORMAT, default=PROFILE_FORMAT_PSTATS): vol.In(
+            PROFILE_FORMATS
+        ),
+        vol.Optional(ATTR_TOP, default=20): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=500)
+        ),
+    }
+)
+
+REFRESH_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_ENTRY_ID): str,
+        vol.Optional(ATTR_PLANTS, default=list(PLANTS)): vol.All(
+            cv.ensure_list, [vol.In(list(PLANTS))]
+        ),
+        vol.Optional(ATTR_MAX_AGE, default=DEFAULT_REFRESH_MAX_AGE): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+
+@callback
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_profile(call: ServiceCall) -> ServiceResponse:
+        """Profile the next refresh cycles and write the result to the config directory."""
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_ENTRY_ID))
+        if coordinator.profiler is not None:
+            raise HomeAssistantError("A profile is already running")
+
+        # cProfile and pstats are only needed once a profile is requested
+        from .profiler import RefreshProfiler
+
+        profiler = RefreshProfiler(call.data[ATTR_CYCLES])
+        coordinator.profiler = profiler
+        try:
+            # Profile the first cycle right away, then wait for the scheduled
+            # refreshes rather than fetching from upstream back to back
+            await coordinator.async_refresh()
+            if not profiler.done and not coordinator.closed:
+                timeout = profiler.remaining * (
+                    coordinator.update_interval.total_seconds() + REQUEST_TIMEOUT
+                )
+                try:
+                    await asyncio.wait_for(profiler.finished.wait(), timeout)
+                except asyncio.TimeoutError:
+                    _LOGGER.warning(
+                        "Profiled %s of %s refresh cycles, the others didn't run in %.0f seconds",
+                        profiler.cycles,
+                        call.data[ATTR_CYCLES],
+                        timeout,
+                    )
+            if coordinator.closed:
+                raise HomeAssistantError(
+                    "Swedish Nuclear Power was unloaded while profiling"
+                )
+        finally:
+            coordinator.profiler = None
+
+        output_format = call.data[ATTR_FORMAT]
+        extension = "prof" if output_format == PROFILE_FORMAT_PSTATS else "collapsed"
+        path = hass.config.path(
+            f"{DOMAIN}_profile_{dt_util.now():%Y%m%d_%H%M%S}.{extension}"
+        )
+        summary = await hass.async_add_executor_job(
+            profiler.report, path, output_format, call.data[ATTR_TOP]
+        )
+        return {"file": path, **summary}
+
+    async def async_refresh(call: ServiceCall) -> ServiceResponse:
+        """Refresh the given plants, joining fetches already in flight."""
+        coordinator = _get_coordinator(hass, call.data.get(ATTR_ENTRY_ID))
+        return await coordinator.async_refresh_plants(
+            call.data[ATTR_PLANTS], call.data[ATTR_MAX_AGE]
+        )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REFRESH,
+        async_refresh,
+        schema=REFRESH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _get_coordinator(
+    hass: HomeAssistant, entry_id: Optional[str]
+) -> SwedishNuclearPowerCoordinator:
+    """Return the coordinator of the given (or the first loaded) entry."""
+    coordinators: Dict[str, SwedishNuclearPowerCoordinator] = hass.data.get(DOMAIN, {})
+    if entry_id is not None:
+        coordinator = coordinators.get(entry_id)
+    else:
+        coordinator = next(iter(coordinators.values()), None)
+
+    if coordinator is None:
+        raise ServiceValidationError("Swedish Nuclear Power is not loaded")
+    return coordinator
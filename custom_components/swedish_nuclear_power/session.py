@@ -0,0 +1,85 @@
+"""HTTP session for fetching data from Swedish nuclear power plants.
+
+Importing requests takes longer than the rest of the integration together,
+so ``NuclearPowerClient`` only imports this module in the executor, the first
+time it fetches.
+"""
+
+from __future__ import annotations
+
+import socket
+import threading
+import weakref
+from typing import Any, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+)
+
+
+def create_session() -> Tuple[requests.Session, AbortableHTTPAdapter]:
+    """Create a session whose connections can be aborted through its adapter."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    adapter = AbortableHTTPAdapter()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session, adapter
+
+
+class AbortableHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that can abort its connections, including in-flight requests."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._connections: weakref.WeakSet = weakref.WeakSet()
+        # Executor threads add connections while abort() runs on the event loop
+        self._lock = threading.Lock()
+        self._aborted = False
+        super().__init__()
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        """Create a pool manager whose pools keep track of their connections."""
+        super().init_poolmanager(*args, **kwargs)
+        adapter = self
+
+        def tracking_pool(pool_cls: type) -> type:
+            class TrackingConnectionPool(pool_cls):
+                def _new_conn(self) -> Any:
+                    conn = super()._new_conn()
+                    adapter._track(conn)
+                    return conn
+
+            return TrackingConnectionPool
+
+        self.poolmanager.pool_classes_by_scheme = {
+            scheme: tracking_pool(pool_cls)
+            for scheme, pool_cls in self.poolmanager.pool_classes_by_scheme.items()
+        }
+
+    def _track(self, conn: Any) -> None:
+        """Register a new connection, refusing it once aborted."""
+        with self._lock:
+            if self._aborted:
+                raise ConnectionAbortedError("Session was aborted")
+            self._connections.add(conn)
+
+    def abort(self) -> None:
+        """Shut down the sockets of all connections, unblocking pending reads.
+
+        Connections opened afterwards fail right away.
+        """
+        with self._lock:
+            self._aborted = True
+            connections = list(self._connections)
+        for conn in connections:
+            if (sock := getattr(conn, "sock", None)) is None:
+                continue
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
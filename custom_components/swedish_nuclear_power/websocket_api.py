@@ -0,0 +1,122 @@
+"""Websocket API for Swedish Nuclear Power integration."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Optional
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+
+from .api import diff_reactors, flatten_reactors, reactor_message
+from .const import DEFAULT_COALESCE_WINDOW, DOMAIN, PLANTS, SIGNAL_ENTRY_UNLOADED
+from .coordinator import SwedishNuclearPowerCoordinator
+
+
+@callback
+def async_register_websocket_commands(hass: HomeAssistant) -> None:
+    """Register the websocket commands."""
+    websocket_api.async_register_command(hass, websocket_subscribe)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Optional("entry_id"): str,
+        vol.Optional("plants"): vol.All(cv.ensure_list, [vol.In(list(PLANTS))]),
+        vol.Optional("window", default=DEFAULT_COALESCE_WINDOW): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=3600)
+        ),
+    }
+)
+@callback
+def websocket_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: Dict[str, Any],
+) -> None:
+    """Send a full snapshot, then push coalesced per-reactor deltas."""
+    coordinators: Dict[str, SwedishNuclearPowerCoordinator] = hass.data.get(DOMAIN, {})
+    if (entry_id := msg.get("entry_id")) is None:
+        entry_id = next(iter(coordinators), None)
+    coordinator = coordinators.get(entry_id)
+
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Swedish Nuclear Power is not loaded"
+        )
+        return
+
+    plants = msg.get("plants") or list(PLANTS)
+    window: float = msg["window"]
+    sent = flatten_reactors(coordinator.data, plants)
+    cancel_flush: Optional[Callable[[], None]] = None
+
+    @callback
+    def flush(_now: Any = None) -> None:
+        """Send everything that changed since the last message."""
+        nonlocal sent, cancel_flush
+        cancel_flush = None
+        current = flatten_reactors(coordinator.data, plants)
+        changes = diff_reactors(sent, current)
+        sent = current
+        if changes:
+            connection.send_message(
+                websocket_api.event_message(
+                    msg["id"], {"type": "delta", "reactors": changes}
+                )
+            )
+
+    @callback
+    def handle_update() -> None:
+        """Coalesce coordinator updates over the subscription window."""
+        nonlocal cancel_flush
+        if not window:
+            flush()
+        elif cancel_flush is None:
+            cancel_flush = async_call_later(hass, window, flush)
+
+    remove_listener = coordinator.async_add_listener(handle_update)
+
+    @callback
+    def unsubscribe() -> None:
+        """Stop pushing updates to this subscriber."""
+        remove_listener()
+        remove_unload_listener()
+        if cancel_flush is not None:
+            cancel_flush()
+
+    @callback
+    def handle_unload(unloaded_entry_id: str) -> None:
+        """End the subscription when its entry unloads, so the client resubscribes."""
+        if unloaded_entry_id != entry_id:
+            return
+        connection.subscriptions.pop(msg["id"], None)
+        unsubscribe()
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_FOUND,
+            "Swedish Nuclear Power entry was unloaded",
+        )
+
+    remove_unload_listener = async_dispatcher_connect(
+        hass, SIGNAL_ENTRY_UNLOADED, handle_unload
+    )
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        websocket_api.event_message(
+            msg["id"],
+            {
+                "type": "snapshot",
+                "reactors": [
+                    reactor_message(key, values) for key, values in sent.items()
+                ],
+            },
+        )
+    )
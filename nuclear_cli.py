@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Command line client for Swedish Nuclear Power data, without Home Assistant
+
+Prints one NDJSON line per fetch. With --watch it keeps polling and streams a
+snapshot followed by per-reactor deltas (or a snapshot every time with
+--snapshots) to stdout, for use in data pipelines outside Home Assistant.
+
+With --serve it runs as a local collector: it polls the plants once per
+interval and serves the latest snapshot on a Unix socket, which the
+integration reads in its "local collector" source mode.
+"""
+
+import argparse
+import asyncio
+import importlib
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+INTEGRATION_DIR = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)),
+    "custom_components",
+    "swedish_nuclear_power",
+)
+PACKAGE = "swedish_nuclear_power"
+
+
+def load_integration_module(name):
+    """Import a Home-Assistant-free module from the integration.
+
+    The package __init__ imports Home Assistant, so register a bare package
+    for the integration directory and import the submodule from that.
+    """
+    if PACKAGE not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(PACKAGE, None, is_package=True)
+        package = importlib.util.module_from_spec(spec)
+        package.__path__ = [INTEGRATION_DIR]
+        sys.modules[PACKAGE] = package
+    return importlib.import_module(f"{PACKAGE}.{name}")
+
+
+def emit(message):
+    """Write a single NDJSON line to stdout."""
+    sys.stdout.write(json.dumps(message, separators=(",", ":")) + "\n")
+    sys.stdout.flush()
+
+
+async def run(args):
+    """Fetch once, keep streaming with --watch, or serve with --serve."""
+    api = load_integration_module("api")
+    const = load_integration_module("const")
+
+    plants = args.plant or list(const.PLANTS)
+    loop = asyncio.get_running_loop()
+    # One worker per plant keeps the fetches concurrent and memory bounded
+    executor = ThreadPoolExecutor(max_workers=len(plants))
+    client = api.NuclearPowerClient()
+
+    def executor_job(target, *job_args):
+        return loop.run_in_executor(executor, target, *job_args)
+
+    if args.serve:
+        collector = load_integration_module("collector")
+        try:
+            await collector.SnapshotCollector(
+                client, args.serve, args.interval, executor_job
+            ).async_run()
+        finally:
+            client.close()
+            executor.shutdown(wait=False)
+        return
+
+    previous = None
+    count = 0
+    try:
+        while True:
+            started = loop.time()
+            data = await client.async_fetch_all_plants(executor_job, plants)
+            current = api.flatten_reactors(data, plants)
+            now = datetime.now(timezone.utc).isoformat()
+
+            if previous is None or args.snapshots:
+                emit({
+                    "type": "snapshot",
+                    "time": now,
+                    "reactors": [
+                        api.reactor_message(key, values) for key, values in current.items()
+                    ],
+                })
+            elif changes := api.diff_reactors(previous, current):
+                emit({"type": "delta", "time": now, "reactors": changes})
+
+            # Only the last snapshot is kept between iterations
+            previous = current
+            count += 1
+            if not args.watch or (args.count and count >= args.count):
+                break
+            await asyncio.sleep(max(0, args.interval - (loop.time() - started)))
+    finally:
+        client.close()
+        executor.shutdown(wait=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--watch", action="store_true", help="keep polling and stream updates")
+    parser.add_argument("--serve", metavar="SOCKET", help="run as local collector serving snapshots on this Unix socket")
+    parser.add_argument("--interval", type=float, default=60, help="seconds between fetches in watch and serve mode (default: 60)")
+    parser.add_argument("--snapshots", action="store_true", help="emit full snapshots instead of deltas in watch mode")
+    parser.add_argument("--count", type=int, default=0, help="stop after this many fetches in watch mode (default: run forever)")
+    parser.add_argument("--plant", action="append", help="only fetch this plant (repeatable)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="log fetch progress to stderr")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, stream=sys.stderr)
+
+    if args.serve and args.plant:
+        parser.error("--plant cannot be combined with --serve, the collector always fetches all plants")
+
+    if args.plant:
+        plants = load_integration_module("const").PLANTS
+        unknown = [plant for plant in args.plant if plant not in plants]
+        if unknown:
+            parser.error(f"unknown plant(s): {', '.join(unknown)} (choose from {', '.join(plants)})")
+
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+    except BrokenPipeError:
+        # Downstream consumer went away (e.g. piped into head)
+        sys.stderr.close()
+
+
+if __name__ == "__main__":
+    main()
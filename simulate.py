@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Simulated-time harness for the Swedish Nuclear Power coordinator
+
+Runs SwedishNuclearPowerCoordinator against a replay of a 24 h upstream
+timeline (publishes, outages and slow responses) on a virtual clock, and
+reports upstream requests, bytes, data-freshness lag and CPU per simulated
+day for each scan interval. A day is simulated in a few seconds.
+
+Requires Home Assistant to be installed (the real coordinator is used).
+
+    python3 simulate.py --scan-interval 30 60 300
+    python3 simulate.py --save-timeline day.json
+    python3 simulate.py --timeline day.json --scan-interval 60 --json
+"""
+
+import argparse
+import asyncio
+import bisect
+import json
+import logging
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+
+import requests
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import frame
+
+from custom_components.swedish_nuclear_power.api import REQUEST_TIMEOUT
+from custom_components.swedish_nuclear_power.const import PLANTS
+from custom_components.swedish_nuclear_power.coordinator import SwedishNuclearPowerCoordinator
+
+DAY = 24 * 60 * 60
+
+# Wall-clock time of virtual time zero, used for upstream timestamps
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+# How often each plant publishes new values in the synthetic timeline
+PUBLISH_INTERVALS = {"ringhals": 60, "forsmark": 60, "okg": 300}
+
+# Filler so scraped pages have a realistic size
+PAGE_SIZE = 50_000
+
+
+def synthetic_timeline(seed=0, duration=DAY):
+    """Generate an upstream timeline with publishes, outages and slow periods."""
+    rng = random.Random(seed)
+    plants = {}
+
+    for plant_key, plant_config in PLANTS.items():
+        interval = PUBLISH_INTERVALS.get(plant_key, 60)
+        capacity = plant_config["max_capacity"]
+        # One reactor of the fleet is in outage for the day
+        offline = "F2" if plant_key == "forsmark" else None
+        levels = {reactor: capacity[reactor] * 0.97 for reactor in plant_config["reactors"]}
+
+        versions = []
+        for publish_time in range(0, duration, interval):
+            for reactor in levels:
+                levels[reactor] = min(capacity[reactor], max(0, levels[reactor] + rng.gauss(0, 3)))
+            values = {
+                reactor: 0 if reactor == offline else round(level, 1)
+                for reactor, level in levels.items()
+            }
+            versions.append({"time": publish_time, "values": values})
+
+        outages = []
+        for _ in range(3):
+            start = rng.uniform(0, duration)
+            outages.append([start, start + rng.uniform(300, 1800), rng.choice([500, 502, 503])])
+
+        slow = []
+        for _ in range(4):
+            start = rng.uniform(0, duration)
+            slow.append([start, start + rng.uniform(600, 3600), rng.uniform(2, 45)])
+
+        plants[plant_key] = {"versions": versions, "outages": outages, "slow": slow}
+
+    return {"duration": duration, "seed": seed, "page_size": PAGE_SIZE, "plants": plants}
+
+
+class ReplayServer:
+    """Serve upstream responses from a timeline at the current virtual time.
+
+    Requests see the upstream state at the start of a refresh cycle. Since the
+    client fetches plants concurrently, a cycle takes as long as its slowest
+    request (capped by the request timeout).
+    """
+
+    def __init__(self, timeline):
+        """Initialize."""
+        self.timeline = timeline
+        self.now = 0.0
+        self.requests = 0
+        self.bytes = 0
+        self.cycle_duration = 0.0
+        self._rng = random.Random(timeline.get("seed", 0))
+        self._plant_by_path = {urlsplit(config["url"]).path: key for key, config in PLANTS.items()}
+        self._publish_times = {
+            plant_key: [version["time"] for version in plant["versions"]]
+            for plant_key, plant in timeline["plants"].items()
+        }
+        self._versions = {
+            plant_key: {_timestamp(publish_time): index for index, publish_time in enumerate(publish_times)}
+            for plant_key, publish_times in self._publish_times.items()
+        }
+
+    def session(self):
+        """Return a requests session answered by this server."""
+        return ReplaySession(self)
+
+    def version_at(self, plant_key, now):
+        """Return the index of the newest version published at ``now``."""
+        return bisect.bisect_right(self._publish_times[plant_key], now) - 1
+
+    def version_of(self, plant_key, timestamp):
+        """Return the version index a coordinator timestamp belongs to."""
+        return self._versions[plant_key][timestamp]
+
+    def publish_time(self, plant_key, version):
+        """Return when a version was published."""
+        return self._publish_times[plant_key][version]
+
+    def take_cycle_duration(self):
+        """Return and reset the virtual duration of the current cycle."""
+        duration, self.cycle_duration = self.cycle_duration, 0.0
+        return duration
+
+    def get(self, url, timeout):
+        """Answer a request at the current virtual time."""
+        plant_key = self._plant_by_path[urlsplit(url).path]
+        plant = self.timeline["plants"][plant_key]
+        self.requests += 1
+
+        latency = self._rng.uniform(0.2, 0.8)
+        for start, end, slow_latency in plant["slow"]:
+            if start <= self.now < end:
+                latency = slow_latency
+        read_timeout = timeout if isinstance(timeout, (int, float)) else timeout[-1]
+        if latency > read_timeout:
+            self.cycle_duration = max(self.cycle_duration, read_timeout)
+            raise requests.Timeout(f"Replay of {url} timed out after {read_timeout}s")
+        self.cycle_duration = max(self.cycle_duration, latency)
+
+        response = requests.Response()
+        response.url = url
+        response.encoding = "utf-8"
+        response.status_code = 200
+        for start, end, status in plant["outages"]:
+            if start <= self.now < end:
+                response.status_code = status
+        if response.status_code != 200:
+            response._content = b"Service Unavailable"
+        else:
+            response._content = self._render(plant_key, self.version_at(plant_key, self.now))
+        self.bytes += len(response._content)
+        return response
+
+    def _render(self, plant_key, version):
+        """Render the upstream document of a plant version."""
+        plant_config = PLANTS[plant_key]
+        published = self.timeline["plants"][plant_key]["versions"][version]
+        timestamp = _timestamp(published["time"])
+
+        if plant_config.get("api", False):
+            return json.dumps({
+                "value": published["values"]["O3"],
+                "timestamp": timestamp,
+                "valueDate": timestamp,
+            }).encode()
+
+        document = json.dumps({
+            "powerPlant": plant_config["name"],
+            "timestamp": timestamp,
+            "blockProductionDataList": [
+                {
+                    "name": reactor,
+                    "production": value,
+                    "percent": round(value / plant_config["max_capacity"][reactor] * 100, 1),
+                    "valueDate": timestamp,
+                }
+                for reactor, value in published["values"].items()
+            ],
+        })
+        filler = " " * max(0, self.timeline.get("page_size", PAGE_SIZE) - len(document))
+        return (
+            f'<html><body>{filler}<script type="application/json">{document}</script></body></html>'
+        ).encode()
+
+
+def _timestamp(virtual_time):
+    """Return the upstream timestamp for a virtual time."""
+    return (EPOCH + timedelta(seconds=virtual_time)).isoformat()
+
+
+class ReplaySession(requests.Session):
+    """A requests session whose GET requests are answered by a ReplayServer."""
+
+    def __init__(self, server):
+        super().__init__()
+        self.server = server
+
+    def get(self, url, **kwargs):
+        return self.server.get(url, kwargs.get("timeout", REQUEST_TIMEOUT))
+
+
+def freshness(server, deliveries, duration, step=1.0):
+    """Sample how far behind upstream the coordinator data was.
+
+    At every sample, the lag is zero when the coordinator holds the newest
+    published version, otherwise the time since the first version it missed
+    was published. Samples where a plant had no data count as unavailable.
+    """
+    lags = []
+    unavailable = 0
+    samples = 0
+
+    for plant_key, plant_deliveries in deliveries.items():
+        times = [delivered for delivered, _ in plant_deliveries]
+        t = 0.0
+        while t < duration:
+            samples += 1
+            index = bisect.bisect_right(times, t) - 1
+            held = plant_deliveries[index][1] if index >= 0 else None
+            if held is None:
+                unavailable += 1
+            else:
+                latest = server.version_at(plant_key, t)
+                lags.append(0.0 if held >= latest else t - server.publish_time(plant_key, held + 1))
+            t += step
+
+    return lags, unavailable / samples if samples else 0.0
+
+
+async def simulate(timeline, scan_interval):
+    """Simulate one configuration and return its metrics."""
+    hass = HomeAssistant(tempfile.mkdtemp())
+    frame.async_setup(hass)
+    coordinator = SwedishNuclearPowerCoordinator(hass, scan_interval)
+    server = ReplayServer(timeline)
+    coordinator.client.session = server.session()
+
+    duration = timeline["duration"]
+    deliveries = {plant_key: [] for plant_key in timeline["plants"]}
+    delivered_versions = {plant_key: set() for plant_key in timeline["plants"]}
+    refreshes = 0
+    cpu = 0.0
+    now = 0.0
+
+    while now < duration:
+        server.now = now
+        started = time.process_time()
+        await coordinator.async_refresh()
+        cpu += time.process_time() - started
+        refreshes += 1
+
+        # The coordinator schedules the next refresh when this one is done
+        done = now + server.take_cycle_duration()
+        data = coordinator.data or {}
+        for plant_key in deliveries:
+            if plant_key in data:
+                version = server.version_of(plant_key, data[plant_key]["timestamp"])
+                delivered_versions[plant_key].add(version)
+            else:
+                version = None
+            deliveries[plant_key].append((done, version))
+        now = done + scan_interval
+
+    lags, unavailable = freshness(server, deliveries, duration)
+    published = sum(len(plant["versions"]) for plant in timeline["plants"].values())
+    missed = published - sum(len(versions) for versions in delivered_versions.values())
+    days = duration / DAY
+
+    return {
+        "scan_interval": scan_interval,
+        "refreshes_per_day": round(refreshes / days),
+        "requests_per_day": round(server.requests / days),
+        "mb_per_day": round(server.bytes / days / 1_000_000, 2),
+        "lag_mean_s": round(statistics.fmean(lags), 1) if lags else None,
+        "lag_p95_s": round(statistics.quantiles(lags, n=20)[-1], 1) if len(lags) > 1 else None,
+        "lag_max_s": round(max(lags), 1) if lags else None,
+        "missed_versions": missed,
+        "unavailable_pct": round(unavailable * 100, 2),
+        "cpu_s_per_day": round(cpu / days, 3),
+    }
+
+
+def print_table(results):
+    """Print the metrics as a table."""
+    columns = list(results[0])
+    widths = [max(len(column), *(len(str(result[column])) for result in results)) for column in columns]
+    print("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for result in results:
+        print("  ".join(str(result[column]).rjust(width) for column, width in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--scan-interval", type=int, nargs="+", default=[60], help="scan intervals in seconds to compare (default: 60)")
+    parser.add_argument("--timeline", help="replay this timeline file instead of a synthetic day")
+    parser.add_argument("--save-timeline", metavar="FILE", help="write the synthetic timeline to FILE and exit")
+    parser.add_argument("--seed", type=int, default=0, help="seed for the synthetic timeline (default: 0)")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the coordinator's log output")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)
+
+    if args.timeline:
+        with open(args.timeline, "r") as f:
+            timeline = json.load(f)
+    else:
+        timeline = synthetic_timeline(args.seed)
+
+    if args.save_timeline:
+        with open(args.save_timeline, "w") as f:
+            json.dump(timeline, f)
+        return
+
+    results = []
+    for scan_interval in args.scan_interval:
+        started = time.perf_counter()
+        results.append(asyncio.run(simulate(timeline, scan_interval)))
+        print(f"Simulated {timeline['duration'] / DAY:g} day(s) at {scan_interval}s in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print_table(results)
+
+
+if __name__ == "__main__":
+    main()
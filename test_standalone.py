@@ -3,161 +3,24 @@
 Standalone test for Swedish Nuclear Power data fetching
 """
 
+import asyncio
 import sys
 import os
 import json
-import requests
-import re
+import logging
 from datetime import datetime
 
-# Plant configurations
-PLANTS = {
-    "ringhals": {
-        "name": "Ringhals",
-        "url": "https://karnkraft.vattenfall.se/ringhals/produktion",
-        "reactors": ["R3", "R4"],
-        "max_capacity": {"R3": 1074, "R4": 1130},  # Maximum capacity in MW from technical data
-    },
-    "forsmark": {
-        "name": "Forsmark", 
-        "url": "https://karnkraft.vattenfall.se/forsmark/produktion",
-        "reactors": ["F1", "F2", "F3"],
-        "max_capacity": {"F1": 1014, "F2": 1121, "F3": 1172},  # Maximum capacity in MW from technical data
-    },
-    "okg": {
-        "name": "Oskarshamn",
-        "url": "https://okg.se/.netlify/functions/getReactorOutput",
-        "reactors": ["O3"],
-        "api": True,
-        "max_capacity": {"O3": 1450},  # Maximum capacity in MW for percentage calculation
-    },
-}
+from nuclear_cli import load_integration_module
 
-class NuclearDataFetcher:
-    """Standalone nuclear data fetcher for testing."""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-    
-    def fetch_all_plants(self):
-        """Fetch data from all nuclear plants."""
-        all_data = {}
-        
-        for plant_key, plant_config in PLANTS.items():
-            try:
-                if plant_config.get("api", False):
-                    # O3 API call
-                    data = self.fetch_okg_data(plant_config)
-                else:
-                    # Vattenfall scraping
-                    data = self.fetch_vattenfall_data(plant_key, plant_config)
-                
-                if data:
-                    all_data[plant_key] = data
-                    
-            except Exception as e:
-                print(f"❌ Failed to fetch data from {plant_config['name']}: {e}")
-                continue
-        
-        return all_data
-    
-    def fetch_vattenfall_data(self, plant_key, plant_config):
-        """Fetch data from Vattenfall plants."""
-        try:
-            url = plant_config["url"]
-            print(f"📡 Fetching data from {url}")
-            
-            response = self.session.get(url, timeout=30)
-            response.raise_for_status()
-            
-            data = self.extract_production_data(response.text, plant_key)
-            if data:
-                print(f"✅ Successfully extracted data for {plant_key}")
-                return data
-            else:
-                print(f"❌ Failed to extract data from {plant_key}")
-                return None
-                
-        except requests.RequestException as e:
-            print(f"❌ Request error for {plant_key}: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Unexpected error for {plant_key}: {e}")
-            return None
-    
-    def extract_production_data(self, html_content, plant_name):
-        """Extract production data from JSON embedded in HTML."""
-        try:
-            # Look for JSON data in script tags
-            pattern = r'<script[^>]*type="application/json"[^>]*>(.*?)</script>'
-            matches = re.findall(pattern, html_content, re.DOTALL)
-            
-            for match in matches:
-                try:
-                    json_data = json.loads(match.strip())
-                    if 'powerPlant' in json_data and 'blockProductionDataList' in json_data:
-                        if json_data['powerPlant'].lower() == plant_name.lower():
-                            return {
-                                'timestamp': json_data.get('timestamp'),
-                                'power_plant': json_data['powerPlant'],
-                                'data': json_data['blockProductionDataList']
-                            }
-                except json.JSONDecodeError:
-                    continue
-            
-            print(f"⚠️ No valid JSON data found for {plant_name}")
-            return None
-            
-        except Exception as e:
-            print(f"❌ Error extracting data for {plant_name}: {e}")
-            return None
-    
-    def fetch_okg_data(self, plant_config):
-        """Fetch data from OKG O3 API."""
-        try:
-            url = plant_config["url"]
-            print(f"📡 Fetching data from {url}")
-            
-            # OKG API requires format parameter
-            response = self.session.get(f"{url}?format=json", timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # Calculate percentage for O3 using max capacity
-            max_capacity = plant_config.get("max_capacity", {}).get("O3", 1450)
-            current_power = data.get('value', 0)
-            percentage = (current_power / max_capacity * 100) if max_capacity > 0 else 0
-            
-            # OKG returns single reactor data
-            return {
-                'timestamp': data.get('timestamp'),
-                'power_plant': plant_config['name'],
-                'data': [{
-                    'name': 'O3',
-                    'production': current_power,
-                    'percent': round(percentage, 1),
-                    'unit': 'MW',
-                    'valueDate': data.get('valueDate')
-                }]
-            }
-            
-        except requests.RequestException as e:
-            print(f"❌ Request error for OKG: {e}")
-            return None
-        except Exception as e:
-            print(f"❌ Unexpected error for OKG: {e}")
-            return None
+api = load_integration_module("api")
+PLANTS = load_integration_module("const").PLANTS
 
 def test_integration():
     """Test integration data fetching."""
     print("🚀 Swedish Nuclear Power Integration Test")
     print("=" * 50)
     
-    fetcher = NuclearDataFetcher()
+    client = api.NuclearPowerClient()
     
     print("📊 Plant Details:")
     for plant_key, plant_config in PLANTS.items():
@@ -166,7 +29,8 @@ def test_integration():
         print(f"    API: {plant_config.get('api', False)}")
     
     print("\n🔄 Fetching data from all plants...")
-    data = fetcher.fetch_all_plants()
+    data = asyncio.run(client.async_fetch_all_plants())
+    client.close()
     
     if data:
         print(f"✅ Successfully fetched data from {len(data)} plants")
@@ -207,6 +71,7 @@ def test_integration():
         for plant_key, plant_config in PLANTS.items():
             for reactor in plant_config['reactors']:
                 print(f"  • sensor.{plant_key}_{reactor.lower()}_power")
+            print(f"  • sensor.{plant_key}_total_power")
             print(f"  • sensor.{plant_key}_last_update")
         print(f"  • sensor.swedish_nuclear_power_total_power")
         
@@ -219,11 +84,16 @@ def test_file_structure():
     
     required_files = [
         'custom_components/swedish_nuclear_power/__init__.py',
+        'custom_components/swedish_nuclear_power/api.py',
+        'custom_components/swedish_nuclear_power/collector.py',
         'custom_components/swedish_nuclear_power/manifest.json',
         'custom_components/swedish_nuclear_power/const.py',
         'custom_components/swedish_nuclear_power/config_flow.py',
         'custom_components/swedish_nuclear_power/coordinator.py',
         'custom_components/swedish_nuclear_power/sensor.py',
+        'custom_components/swedish_nuclear_power/services.py',
+        'custom_components/swedish_nuclear_power/session.py',
+        'custom_components/swedish_nuclear_power/websocket_api.py',
         'custom_components/swedish_nuclear_power/options.py',
         'custom_components/swedish_nuclear_power/translations/en.json',
     ]
@@ -276,6 +146,8 @@ def test_manifest():
         return False
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+
     print("🔬 Swedish Nuclear Power Integration Test Suite")
     print("=" * 60)
     